@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from config.enums import Agents
 from prompts.DiscoveryEntityExtractionPrompt import SYSTEM_PROMPT_ENTITY_EXTRACTION
@@ -9,6 +10,8 @@ from config.enums import ModelType
 from core.llm_client import LLMClient
 from config.enums import ProductAttributes as pa
 
+_get_key = itemgetter("key")
+
 
 class DiscoveryAgent:
     def __init__(self, subcategory: str, llm_client: Optional[LLMClient] = None):
@@ -21,14 +24,15 @@ class DiscoveryAgent:
         self.mandatory_entities: List = [pa.SUBCATEGORY]
 
     async def ask_specification(self, user_given_specs, specification_list):
-        user_given_specs_keys = [obj["key"] for obj in user_given_specs]
+        user_given_specs_keys = list(map(_get_key, user_given_specs))
         # given_specs = [obj for obj in specification_list if obj["key"] in user_given_specs_keys]
-        other_specs = [obj for obj in specification_list if obj["spec_name"].lower() not in user_given_specs_keys]
+        given_keys = set(user_given_specs_keys)
+        other_specs = [obj for obj in specification_list if obj["spec_name"].lower() not in given_keys]
         return {"given_specs": user_given_specs_keys, "other_available_specs": other_specs}
 
     async def create_spec_statement(self, user_given_specs, specification_list):
-        user_given_specs_keys = [obj["key"] for obj in user_given_specs]
         spec_dict = await self.ask_specification(user_given_specs, specification_list)
+        user_given_specs_keys = spec_dict["given_specs"]
         statement = ""
         if user_given_specs:
             statement += f"Apart from from these spec(s) - {', '.join(user_given_specs_keys)}, there are more available specification. "
@@ -36,18 +40,20 @@ class DiscoveryAgent:
             statement += f"Below are the available specifications. "
         statement += "Please add few specs to filter your search.\n"
 
-        # Prepare rows
+        # Prepare rows and column widths in one pass; widths start at the header widths
+        # so the header row always fits
         rows = []
+        col1_width, col2_width = len("Specification"), len("Example")
         for spec in spec_dict["other_available_specs"]:
             label = spec["spec_name_label"]
             value = spec["spec_value"]
             unit = spec["unit"]
             example = f"{value} {unit}" if unit else value
             rows.append((label, example))
-
-        # Determine column widths
-        col1_width = max(len(r[0]) for r in rows)
-        col2_width = max(len(r[1]) for r in rows)
+            if len(label) > col1_width:
+                col1_width = len(label)
+            if len(example) > col2_width:
+                col2_width = len(example)
 
         # Build table
         line = "+" + "-" * (col1_width + 2) + "+" + "-" * (col2_width + 2) + "+"
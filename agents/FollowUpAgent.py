@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from prompts.FollowUpPrompt import DiscoveryFollowUpPrompt
 import json
 from config.enums import ChatInfo
-import re
+from agents.base import dump_prompt_json, parse_llm_json
 
 class FollowupAgent:
     def __init__(self):
@@ -15,22 +15,10 @@ class FollowupAgent:
             "Question": user_query,
             "Answer": ai_response
         }
-        return json.dumps(input_json, indent=2)
+        return dump_prompt_json(input_json)
 
     async def parse_llm_json(self, text: str):
-        try:
-            # Remove known code fences
-            cleaned = text.replace("```json", "").replace("```", "").strip()
-
-            # Optional: extract the JSON object if extra text exists
-            match = re.search(r'\{[\s\S]*\}', cleaned)
-            if match:
-                cleaned = match.group(0)
-
-            return json.loads(cleaned)
-
-        except json.JSONDecodeError as e:
-            raise ValueError("LLM returned invalid JSON") from e
+        return parse_llm_json(text)
 
     async def run(self, current_query: str, ai_response) -> str:
         system_prompt = DiscoveryFollowUpPrompt
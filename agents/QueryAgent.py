@@ -3,7 +3,10 @@ from typing import Any, Dict, List, Optional
 from prompts.QueryTool import get_system_prompt_query_tool
 import json
 from config.enums import ChatInfo
-import re
+from agents.base import dump_prompt_json, parse_llm_json
+
+# Only these chat fields are sent to the LLM as conversation history
+_HISTORY_KEYS = (ChatInfo.user_message.value, ChatInfo.ai_message.value)
 
 class QueryAgent:
     def __init__(self):
@@ -23,19 +26,15 @@ class QueryAgent:
             last_chat = chats[-1]
         else:
             last_chat = {}
-        if ChatInfo.processed.value in last_chat.keys():
-            processed_list = last_chat[ChatInfo.processed.value]
-            for processed in  processed_list:
-                if processed.get("process_name") == "ENTITY_EXTRACTION":
-                    nlu_result = processed.get("output", [])
-                    break
+        for processed in last_chat.get(ChatInfo.processed.value, ()):
+            if processed.get("process_name") == "ENTITY_EXTRACTION":
+                nlu_result = processed.get("output", [])
+                break
 
-        keys_to_keep = {
-            ChatInfo.user_message.value,
-            ChatInfo.ai_message.value,
-        }
+        # Probe the two kept keys instead of walking every field of every chat
+        # (chats also carry bulky "processed" payloads such as query results)
         chats = [
-            {k: v for k, v in chat.items() if k in keys_to_keep}
+            {k: chat[k] for k in _HISTORY_KEYS if k in chat}
             for chat in chats
         ]
 
@@ -46,22 +45,10 @@ class QueryAgent:
             "conversation_history": chats
         }
         # As string, ready for LLM
-        return json.dumps(input_json, indent=2)
+        return dump_prompt_json(input_json)
 
     async def parse_llm_json(self, text: str):
-        try:
-            # Remove known code fences
-            cleaned = text.replace("```json", "").replace("```", "").strip()
-
-            # Optional: extract the JSON object if extra text exists
-            match = re.search(r'\{[\s\S]*\}', cleaned)
-            if match:
-                cleaned = match.group(0)
-
-            return json.loads(cleaned)
-
-        except json.JSONDecodeError as e:
-            raise ValueError("LLM returned invalid JSON") from e
+        return parse_llm_json(text)
 
     async def run(self, current_query: str, consolidated_entities, specification_list: List[Dict[str, Any]], chats: List[Dict[str, Any]], subcategory: Optional[str] = None) -> Dict[str, Any]:
         system_prompt = await get_system_prompt_query_tool(subcategory, specification_list)
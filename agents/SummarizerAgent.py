@@ -1,6 +1,7 @@
-import json
+import asyncio
 from typing import Any, Dict, List, Optional
 
+from agents.base import dump_prompt_json, parse_llm_json
 from config.enums import ChatInfo
 from core.llm_client import LLMClient
 from prompts.Summarizer import get_summarizer_prompt
@@ -39,18 +40,14 @@ class SummarizerAgent:
             "conversation_history": trimmed_chats,
             "query_result": qr_payload,
         }
-        return json.dumps(payload, indent=2)
+        return dump_prompt_json(payload)
 
     async def _parse_llm_json(self, text: str) -> Dict[str, Any]:
-        cleaned = text.replace("```json", "").replace("```", "").strip()
         try:
-            start = cleaned.find("{")
-            end = cleaned.rfind("}")
-            if start != -1 and end != -1:
-                cleaned = cleaned[start : end + 1]
-            return json.loads(cleaned)
-        except Exception:
-            return {"answer": cleaned}
+            return parse_llm_json(text)
+        except ValueError:
+            # Not JSON at all: treat the whole reply as the answer
+            return {"answer": text.replace("```json", "").replace("```", "").strip()}
 
     def _format_response(self, parsed: Dict[str, Any]) -> str:
         answer = parsed.get("answer")
@@ -124,15 +121,18 @@ async def main():
         },
     ]
 
-    for scenario in scenarios:
-        print(f"\n=== Scenario: {scenario['name']} ===")
-        out = await agent.run(
+    # Scenarios are independent: issue them together, then print in order
+    outputs = await asyncio.gather(*(
+        agent.run(
             current_query=scenario["current_query"],
             chats=scenario["chats"],
             query_result=scenario["query_result"],
         )
+        for scenario in scenarios
+    ))
+    for scenario, out in zip(scenarios, outputs):
+        print(f"\n=== Scenario: {scenario['name']} ===")
         print(out)
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -1,45 +1,107 @@
+import json
+import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Protocol
 
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+_DECODER = json.JSONDecoder()
+
+# orjson is optional; it serialises the prompt payloads several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compact like orjson's default output: indentation whitespace is only extra prompt tokens.
+# Non-ASCII product text stays UTF-8 (as orjson emits it) rather than \uXXXX escapes.
+_PROMPT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def dump_prompt_json(obj: Any) -> str:
+    """Serialise a payload for embedding in an LLM prompt."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Types orjson does not know; let the stdlib encoder handle (or reject) them
+            pass
+    return _PROMPT_ENCODER.encode(obj)
+
+
+def decode_first_json(text: str, opener: str = "{") -> Optional[Any]:
+    """
+    Decode the JSON value starting at the first `opener` ("{" or "[") in place, or None.
+    Fences and prose around a well-formed value are never copied or rescanned.
+    """
+    start = text.find(opener)
+    if start == -1:
+        return None
+    try:
+        return _DECODER.raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        return None
+
+
+def parse_llm_json(text: str) -> Dict[str, Any]:
+    """Parse the JSON object in an LLM reply, ignoring code fences and surrounding text."""
+    parsed = decode_first_json(text)
+    if parsed is not None:
+        return parsed
+
+    try:
+        # Remove known code fences
+        cleaned = text.replace("```json", "").replace("```", "").strip()
+
+        # Optional: extract the JSON object if extra text exists
+        match = _JSON_OBJECT_RE.search(cleaned)
+        if match:
+            cleaned = match.group(0)
+
+        return _DECODER.decode(cleaned)
+
+    except json.JSONDecodeError as e:
+        raise ValueError("LLM returned invalid JSON") from e
+
 class Action:
-    pass
+    # Empty slots so the slotted subclasses below don't get a __dict__ anyway
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True)
 class Ask(Action):
     question: str
     slot: Optional[str] = None
     def __repr__(self): return f"ASK({self.question})"
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall(Action):
     name: str
     params: Dict[str, Any]
     def __repr__(self): return f"TOOL({self.name}, {self.params})"
 
-@dataclass
+@dataclass(slots=True)
 class Present(Action):
     items: List[Dict[str, Any]]
     affordances: List[str]
     text: Optional[str] = None
     def __repr__(self): return f"PRESENT({len(self.items)} items)"
 
-@dataclass
+@dataclass(slots=True)
 class Commit(Action):
     result: Dict[str, Any]
     def __repr__(self): return f"COMMIT({self.result})"
 
-@dataclass
+@dataclass(slots=True)
 class Info(Action):
     message: str
     def __repr__(self): return f"INFO({self.message})"
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     workstream: Any
     session: Dict[str, Any]
     nlu_result: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     action: Action
     updated_slots: Optional[Dict[str, Any]] = None
@@ -47,7 +109,7 @@ class AgentOutput:
     satisfaction_delta: float = 0.0
     mark_completed: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Confirm:
     type: str = "confirm"
     text: str = ""
@@ -6,6 +6,7 @@ import json
 import ast
 import logging
 from config.utils import get_specification_list
+from nlu.discovery_nlu import build_spec_prompt_prefix
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -46,22 +47,7 @@ class EntityExtractionAgent:
                 return []
 
     async def get_user_prompt(self, question):
-        user_prompt = "Input:\n"
-        user_prompt += f"Product: {self.subcategory}\n"
-        user_prompt += "Available specs:\n"
-        spec_list_label = [spec["spec_name_label"].lower() for spec in self.spec_list]
-        for obj in self.spec_list:
-            str_ = ""
-            str_ += f"\t- {obj['spec_name_label']}: datatype={obj['data_type']}, "
-            if obj["unit"] is not None:
-                str_ += f"unit - {obj['unit']}. "
-                str_ += f"example - **{obj['spec_value']} {obj['unit']}."
-            else:
-                str_ += f"example - {obj['spec_value']}."
-            user_prompt += str_ + "\n"
-        user_prompt += f"Note: Use lowercase keys exactly as listed (e.g. {', '.join(spec_list_label)}) \n"
-        user_prompt += f"\nuser prompt - {question}"
-        return user_prompt
+        return f"{build_spec_prompt_prefix(self.subcategory, self.spec_list)}\nuser prompt - {question}"
 
     async def extract_entities(self, llm_output_dict):
         entities = []
@@ -105,6 +105,7 @@ class DataFrameLookup(str, Enum):
 
 class ConverstionVars(str, Enum):
     max_turns = 5 # max turns per conversation to pull
+    max_history_chars = 512 # past messages longer than this are clipped in the planner prompt
 
 class LlmVars(str, Enum):
     max_calls = 3
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import os
@@ -16,6 +17,12 @@ spec_path = BASE_DIR / db_root / db_specification
 product_db = pd.read_json(product_path)
 spec_db = pd.read_json(spec_path)
 
+# Lowercased once so subcategory matching doesn't re-lower the column per call
+_product_subcategory_lower = product_db['subcategory_name'].str.lower()
+
+# product_id -> that product's spec rows, so lookups skip a full-column scan
+_spec_rows_by_product = dict(tuple(spec_db.groupby('product_id')))
+
 
 def _match_subcategory_rows(subcategory: str):
     if not subcategory:
@@ -26,25 +33,39 @@ def _match_subcategory_rows(subcategory: str):
         lowered.rstrip("s"),
         f"{lowered}s",
     }
-    return product_db[product_db['subcategory_name'].str.lower().isin(candidates)]
+    return product_db[_product_subcategory_lower.isin(candidates)]
 
 
 def get_specification_list(subcategory):
-    specification_list = []
+    # Each caller gets its own dicts so mutating them cannot leak into the cache
+    return [dict(spec_row) for spec_row in _specification_rows(subcategory)]
+
+
+@lru_cache(maxsize=128)
+def _specification_rows(subcategory):
+    """Spec rows for a subcategory; the tables are static, so results are memoized."""
     product_subcat = _match_subcategory_rows(subcategory)
     if product_subcat.empty:
-        return specification_list
+        return ()
 
     product_id = product_subcat.iloc[0]["product_id"]
-    required_spec_df = spec_db[spec_db['product_id'] == product_id]
-
-    for _, row in required_spec_df.iterrows():
-        spec_row = {
-            "spec_name": row['spec_name'],
-            "spec_value": row['spec_value'],
-            "spec_name_label": row['spec_name'].replace("_", " "),
-            "unit": row['unit'],
-            "data_type": row['data_type']
+    required_spec_df = _spec_rows_by_product.get(product_id)
+    if required_spec_df is None:
+        return ()
+
+    # Walk the columns directly; iterrows builds a Series for every row
+    return tuple(
+        {
+            "spec_name": spec_name,
+            "spec_value": spec_value,
+            "spec_name_label": spec_name.replace("_", " "),
+            "unit": unit,
+            "data_type": data_type
         }
-        specification_list.append(spec_row)
-    return specification_list
+        for spec_name, spec_value, unit, data_type in zip(
+            required_spec_df['spec_name'],
+            required_spec_df['spec_value'],
+            required_spec_df['unit'],
+            required_spec_df['data_type'],
+        )
+    )
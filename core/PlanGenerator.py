@@ -3,9 +3,9 @@ import os
 import asyncio
 from config.enums import ModelType
 from core.llm_client import LLMClient
+from agents.base import parse_llm_json
 from prompts.PlanGenerator import get_discovery_plan_generator_prompt
 from config.enums import Agents, ChatInfo
-import json
 
 class PlanGenerator:
     def __init__(self, type: str, llm_client: Optional[LLMClient] = None):
@@ -15,7 +15,8 @@ class PlanGenerator:
         self.spec_nlu_response = None
 
     async def get_clean_response(self, raw_response: str) -> str:
-        return json.loads(raw_response)
+        # Shared agent parser: decodes the plan in place and tolerates ```json fences
+        return parse_llm_json(raw_response)
 
     async def get_user_msg(self, user_query: str, chats: List[Dict[str, Any]]) -> str:
         input = {"current_query": user_query, "conversation_history": chats}
@@ -7,6 +7,8 @@ Design goals:
   requested via `filters` to reduce memory usage.
 - Supports CSV and JSON (full read) out of the box. Uses chunked read for CSV
   when a simple equality filter is provided to avoid loading entire file.
+- Full (unfiltered) reads are kept in a small LRU cache and reused until the
+  file's mtime or size changes; each executor gets its own copy.
 - Executes the LLM code with a tight local namespace exposing only:
     - pandas as pd
     - numpy as np
@@ -15,9 +17,10 @@ Design goals:
 """
 
 import os
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 
 
 class QueryExecutorSimple:
@@ -32,6 +35,26 @@ class QueryExecutorSimple:
         "df_review": "review",
     }
 
+    # path -> ((mtime, size), parsed DataFrame) for full-file reads, shared across
+    # executors; least recently used entries are evicted past _FILE_CACHE_SIZE
+    _FILE_CACHE: "OrderedDict[str, Tuple[Tuple[float, int], pd.DataFrame]]" = OrderedDict()
+    _FILE_CACHE_SIZE = len(FILE_MAP)
+
+    @classmethod
+    def _read_cached(cls, path: str, reader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        """Parse `path` once and hand out copies until the file changes on disk."""
+        stat = os.stat(path)
+        signature = (stat.st_mtime, stat.st_size)
+        cached = cls._FILE_CACHE.get(path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, reader(path))
+            cls._FILE_CACHE[path] = cached
+            while len(cls._FILE_CACHE) > cls._FILE_CACHE_SIZE:
+                cls._FILE_CACHE.popitem(last=False)
+        cls._FILE_CACHE.move_to_end(path)
+        # Executed code may mutate its frames in place; never expose the cached one
+        return cached[1].copy()
+
     @staticmethod
     def _sanitize_code(code_str: str) -> str:
         if not isinstance(code_str, str):
@@ -80,22 +103,27 @@ class QueryExecutorSimple:
         # If CSV exists and a simple equality filter is provided -> use chunks
         if os.path.exists(csv_path) and filter_spec:
             print(f"   → Using chunked CSV read with filters")
+            # Normalise filter values once rather than per chunk; list-likes become
+            # frozensets so isin hashes them directly
+            normalized_filters = {
+                col: frozenset(str(v).lower() for v in val) if isinstance(val, (list, tuple, set)) else str(val).lower()
+                for col, val in filter_spec.items()
+            }
             chunks = []
             total_rows_read = 0
             for chunk in pd.read_csv(csv_path, chunksize=100_000, dtype=str):
                 total_rows_read += len(chunk)
                 mask = pd.Series(True, index=chunk.index)
-                for col, val in filter_spec.items():
+                for col, val in normalized_filters.items():
                     if col not in chunk.columns:
                         print(f"   ⚠️  Column '{col}' not found in data!")
                         mask &= False
                         continue
                     series = chunk[col].astype(str).str.lower()
-                    if isinstance(val, (list, tuple, set)):
-                        vals = [str(v).lower() for v in val]
-                        mask &= series.isin(vals)
+                    if isinstance(val, frozenset):
+                        mask &= series.isin(val)
                     else:
-                        mask &= series == str(val).lower()
+                        mask &= series == val
                 filtered = chunk[mask]
                 if not filtered.empty:
                     chunks.append(filtered)
@@ -117,14 +145,14 @@ class QueryExecutorSimple:
         # If CSV exists and no filters -> load whole CSV
         if os.path.exists(csv_path):
             print(f"   → Loading full CSV (no filters)")
-            result = pd.read_csv(csv_path)
+            result = self._read_cached(csv_path, pd.read_csv)
             print(f"   ✅ Loaded {len(result)} rows")
             return result
 
         # If JSON exists -> load full JSON (assumes it's reasonably sized)
         if os.path.exists(json_path):
             print(f"   → Loading full JSON (no filters)")
-            result = pd.read_json(json_path)
+            result = self._read_cached(json_path, pd.read_json)
             print(f"   ✅ Loaded {len(result)} rows")
             return result
 
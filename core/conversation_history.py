@@ -1,6 +1,7 @@
 # core/conversation_history.py
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple, Union
+from itertools import count
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
 
 from agents.base import Ask
 from config.enums import WorkstreamState, ChatInfo, Agents, WorkflowContinuityDecision as WfCDecision
@@ -9,6 +10,9 @@ from core.workstream import Workstream
 from config.utils import get_specification_list
 import uuid
 
+# Workstream states that never count as pending
+_NON_PENDING_STATES = frozenset({WorkstreamState.COMPLETED})
+
 @dataclass
 class ConversationHistory:
     session_id: str
@@ -18,6 +22,8 @@ class ConversationHistory:
     completed_ws_ids: List[str] = field(default_factory=list)
     session_id = None
     conversation: Dict[str, Any] = field(default_factory=dict)
+    # Monotonic source for ws ids; next() on itertools.count is atomic under the GIL.
+    _ws_id_counter: Iterator[int] = field(default_factory=lambda: count(1), init=False, repr=False, compare=False)
 
     def get_active_workstream(self) -> Workstream | None:
         if self.active_ws_id:
@@ -43,13 +49,7 @@ class ConversationHistory:
         short ws_id will be easy for LLM to match (used in planer prompt).
         """
         # ws_id = uuid.uuid4()
-        ws_id_int_part_list = [ws_id.split("_")[-1] for ws_id in list(self.workstreams.keys())]
-        ws_id_int_part_list.sort()
-        if ws_id_int_part_list:
-            return "ws_id_" + str(ws_id_int_part_list[-1])
-        else:
-            # First Workstream
-            return "ws_id_1"
+        return "ws_id_" + str(next(self._ws_id_counter))
 
     def create_new_workstream(self, phase, target) -> workstream.Workstream:
         ws_id = self.create_ws_id()
@@ -89,11 +89,10 @@ class ConversationHistory:
     #     return False
 
     def get_pending_ws_ids(self) -> List[str]:
-        pending_ws_ids = []
-        for ws_id, ws in self.workstreams.items():
-            if ws.current_state not in [WorkstreamState.COMPLETED] and ws_id not in [self.active_ws_id]:
-                pending_ws_ids.append(ws_id)
-        return pending_ws_ids
+        active_ws_id = self.active_ws_id
+        # Cheap id comparison first; the state check only runs for non-active workstreams
+        return [ws_id for ws_id, ws in self.workstreams.items()
+                if ws_id != active_ws_id and ws.current_state not in _NON_PENDING_STATES]
 
 
 
@@ -1,13 +1,15 @@
 # core/fsm_engine.py
-from typing import Dict, List
+from typing import AbstractSet, Dict
+
+_NO_TRANSITIONS: AbstractSet[str] = frozenset()
 
 class FSMEngine:
-    def __init__(self, transitions: Dict[str, List[str]]):
+    def __init__(self, transitions: Dict[str, AbstractSet[str]]):
         self.transitions = transitions
 
     def can_transition(self, current: str, next_state: str) -> bool:
         """Check if transition is valid."""
-        return next_state in self.transitions.get(current, [])
+        return next_state in self.transitions.get(current, _NO_TRANSITIONS)
 
     def next_state(self, current: str, next_state: str) -> str:
         """Move to next state if valid, else raise error."""
@@ -1,19 +1,20 @@
 from config.enums import PhaseState as ps, WorkstreamState as ws
 
+# Allowed next states per state; frozensets so can_transition is a hashed lookup
 WS_TRANSITIONS = {
-    ws.NEW: [ws.ACTIVE],
-    ws.ACTIVE: [ws.ACTIVE, ws.PENDING, ws.ABORTED, ws.COMPLETED],
-    ws.PENDING: [ws.ACTIVE],
+    ws.NEW: frozenset({ws.ACTIVE}),
+    ws.ACTIVE: frozenset({ws.ACTIVE, ws.PENDING, ws.ABORTED, ws.COMPLETED}),
+    ws.PENDING: frozenset({ws.ACTIVE}),
 }
 
 PHASE_TRANSITIONS = {
-    ps.NEW: [ps.COLLECTING, ps.FAILED],
-    ps.COLLECTING: [ps.READY, ps.COLLECTING, ps.FAILED, ps.PAUSED],
-    ps.READY: [ps.PROCESSING, ps.PRESENTING, ps.FAILED, ps.PAUSED],
-    ps.PROCESSING: [ps.PRESENTING, ps.AWAITING_DECISION, ps.FAILED, ps.PAUSED],
-    ps.PRESENTING: [ps.AWAITING_DECISION, ps.COLLECTING, ps.FAILED, ps.PAUSED],
-    ps.AWAITING_DECISION: [ps.PROCESSING, ps.COLLECTING, ps.FAILED, ps.PAUSED],
-    ps.COMPLETED: [],
-    ps.FAILED: [ps.COLLECTING, ps.COMPLETED],
-    ps.PAUSED: [ps.COLLECTING, ps.READY, ps.AWAITING_DECISION],
+    ps.NEW: frozenset({ps.COLLECTING, ps.FAILED}),
+    ps.COLLECTING: frozenset({ps.READY, ps.COLLECTING, ps.FAILED, ps.PAUSED}),
+    ps.READY: frozenset({ps.PROCESSING, ps.PRESENTING, ps.FAILED, ps.PAUSED}),
+    ps.PROCESSING: frozenset({ps.PRESENTING, ps.AWAITING_DECISION, ps.FAILED, ps.PAUSED}),
+    ps.PRESENTING: frozenset({ps.AWAITING_DECISION, ps.COLLECTING, ps.FAILED, ps.PAUSED}),
+    ps.AWAITING_DECISION: frozenset({ps.PROCESSING, ps.COLLECTING, ps.FAILED, ps.PAUSED}),
+    ps.COMPLETED: frozenset(),
+    ps.FAILED: frozenset({ps.COLLECTING, ps.COMPLETED}),
+    ps.PAUSED: frozenset({ps.COLLECTING, ps.READY, ps.AWAITING_DECISION}),
 }
\ No newline at end of file
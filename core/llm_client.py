@@ -1,10 +1,46 @@
 import os
+import atexit
 import asyncio
-from typing import Optional
+import hashlib
+import shelve
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Exact-match response cache shared by every client: an identical (model, system, user)
+# prompt is answered from memory instead of another LLM round-trip.
+# LLM_CACHE_SIZE=0 disables it.
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+# Optional on-disk tier (shelve file) so repeated dev/test runs survive process restarts.
+# Single-process only: shelve/dbm has no locking, so never point two running processes
+# (e.g. several server workers) at the same LLM_CACHE_PATH.
+_RESPONSE_CACHE_PATH = os.getenv("LLM_CACHE_PATH")
+_disk_cache: Optional[shelve.Shelf] = None
+
+
+def _get_disk_cache() -> Optional[shelve.Shelf]:
+    """Open the shelve file on first use. Only touched from the event loop thread."""
+    global _disk_cache
+    if _disk_cache is None and _RESPONSE_CACHE_PATH:
+        os.makedirs(os.path.dirname(_RESPONSE_CACHE_PATH) or ".", exist_ok=True)
+        _disk_cache = shelve.open(_RESPONSE_CACHE_PATH)
+        atexit.register(_disk_cache.close)
+    return _disk_cache
+
+
+# SDK clients shared by every LLMClient with the same settings, so agents created per
+# turn reuse one HTTP connection pool instead of opening (and TLS-handshaking) new ones
+_SDK_CLIENTS: Dict[Tuple[str, str, str], Any] = {}
+
+
+def _remember(key: str, response_text: str) -> None:
+    _RESPONSE_CACHE[key] = response_text
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
 class LLMClient:
     def __init__(self, model_type: str = "openai", model_name: Optional[str] = None):
         self.model_type = model_type
@@ -25,8 +61,11 @@ class LLMClient:
             import google.generativeai as genai
             api_key = os.getenv("GEMINI_API_KEY", None)
             if api_key:
-                genai.configure(api_key=api_key)
-                self._client = genai.GenerativeModel(self.model_name)
+                client_key = ("gemini", api_key, self.model_name)
+                if client_key not in _SDK_CLIENTS:
+                    genai.configure(api_key=api_key)
+                    _SDK_CLIENTS[client_key] = genai.GenerativeModel(self.model_name)
+                self._client = _SDK_CLIENTS[client_key]
                 self._ready = True
         except Exception as e:
             print(f"Error initializing Gemini client: {e}")
@@ -37,41 +76,94 @@ class LLMClient:
             from openai import OpenAI
             api_key = os.getenv("OPENAI_SECRET_KEY", None)
             if api_key:
-                self._client = OpenAI(api_key=api_key)
+                # The OpenAI client is model-agnostic; one per key is enough
+                client_key = ("openai", api_key, "")
+                if client_key not in _SDK_CLIENTS:
+                    _SDK_CLIENTS[client_key] = OpenAI(api_key=api_key)
+                self._client = _SDK_CLIENTS[client_key]
                 self._ready = True
         except Exception as e:
             print(f"Error initializing OpenAI client: {e}")
             self._ready = False
 
+    def _cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (self.model_type, self.model_name, system_prompt, user_prompt):
+            h.update(str(part).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @staticmethod
+    def _prompt_cache_key(system_prompt: str) -> str:
+        return hashlib.blake2b(str(system_prompt).encode("utf-8"), digest_size=8).hexdigest()
+
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         """Generate content from the selected model (either Gemini or OpenAI)."""
-        prompt = str(system_prompt) + "\n\n" + str(user_prompt)
-
         if self._ready and self._client:
-            try:
-                if self.model_type == "gemini":
-                    response = self._client.generate_content(prompt)
-                    return getattr(response, "text", "").strip() or ""
-                elif self.model_type == "openai":
-                    resp = self._client.chat.completions.create(
-                        model=self.model_name,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        temperature=0
-                    )
-                    return (
-                        resp.choices[0].message.content.strip()
-                        if resp.choices and resp.choices[0].message.content
-                        else ""
-                    )
-            except Exception as e:
-                print(f"LLM API error: {e}")
-                pass
+            key = self._cache_key(system_prompt, user_prompt) if _RESPONSE_CACHE_SIZE > 0 else None
+            if key is not None:
+                cached = _RESPONSE_CACHE.get(key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(key)
+                    return cached
+                disk_cache = _get_disk_cache()
+                if disk_cache is not None:
+                    cached = disk_cache.get(key)
+                    if cached is not None:
+                        _remember(key, cached)
+                        return cached
+
+            # The provider SDKs are blocking; run the call in a worker thread so the event
+            # loop (and any gathered NLU/agent calls) keeps going. Cache bookkeeping stays
+            # on the loop thread.
+            response_text = await asyncio.to_thread(self._call_model, system_prompt, user_prompt)
+            # Empty completions are never cached, so a transient blank reply is retried next time
+            if response_text:
+                if key is not None:
+                    _remember(key, response_text)
+                    disk_cache = _get_disk_cache()
+                    if disk_cache is not None:
+                        disk_cache[key] = response_text
+                return response_text
 
         # Fallback: deterministic echo for tests/demos
-        return f"[LLM-FALLBACK] {prompt[:200]}"
+        return self._fallback_response(system_prompt, user_prompt)
+
+    def _call_model(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Call the configured model; None if the API call failed."""
+        try:
+            if self.model_type == "gemini":
+                # Only Gemini takes a single combined prompt; OpenAI gets separate messages
+                prompt = str(system_prompt) + "\n\n" + str(user_prompt)
+                response = self._client.generate_content(prompt)
+                return getattr(response, "text", "").strip() or ""
+            elif self.model_type == "openai":
+                resp = self._client.chat.completions.create(
+                    model=self.model_name,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0,
+                    # Requests with the same system prompt share a cache-routing key, so the
+                    # provider keeps serving its cached static prefix across turns and agents
+                    prompt_cache_key=self._prompt_cache_key(system_prompt)
+                )
+                return (
+                    resp.choices[0].message.content.strip()
+                    if resp.choices and resp.choices[0].message.content
+                    else ""
+                )
+        except Exception as e:
+            print(f"LLM API error: {e}")
+        return None
+
+    @staticmethod
+    def _fallback_response(system_prompt: str, user_prompt: str) -> str:
+        # Same text as echoing the first 200 chars of the combined prompt, without
+        # concatenating (potentially very long) full prompts just to slice them
+        head = (str(system_prompt)[:200] + "\n\n" + str(user_prompt)[:200])[:200]
+        return f"[LLM-FALLBACK] {head}"
 
 
 # For testing, the following part can be in another script or testing module
@@ -8,7 +8,6 @@ from pathlib import Path
 # DEFAULT_LOG_PATH = Path("/mnt/data/eag_logs")
 # DEFAULT_LOG_PATH = Path("/")
 DEFAULT_LOG_PATH = Path.home() / "eag_logs"
-DEFAULT_LOG_PATH.mkdir(parents=True, exist_ok=True)
 
 def configure_logging(name: str = "eag", level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -24,6 +23,10 @@ def configure_logging(name: str = "eag", level: int = logging.INFO) -> logging.L
 
     # rotating file handler
     fh_path = DEFAULT_LOG_PATH / f"{name}.log"
+    try:
+        DEFAULT_LOG_PATH.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
+        pass  # created concurrently by another process
     fh = RotatingFileHandler(fh_path, maxBytes=2_000_000, backupCount=3)
     fh.setLevel(level)
     fh.setFormatter(logging.Formatter("%(asctime)s	%(levelname)s	%(name)s	%(message)s"))
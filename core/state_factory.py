@@ -2,14 +2,16 @@
 from typing import Union
 from core.states import DiscoveryState, OrderState
 
+# Built once at import instead of on every initial_state() call
+_INITIAL_STATES = {
+    "DISCOVERY": DiscoveryState.NEW,
+    "ORDER": OrderState.NEW,
+    "RETURN": OrderState.NEW,
+    "EXCHANGE": OrderState.NEW,
+    "PAYMENT": OrderState.NEW,
+    # Add other intents as needed
+}
+
 def initial_state(intent: str) -> Union[DiscoveryState, OrderState, str]:
     """Return the initial FSM state for a given intent."""
-    mapping = {
-        "DISCOVERY": DiscoveryState.NEW,
-        "ORDER": OrderState.NEW,
-        "RETURN": OrderState.NEW,
-        "EXCHANGE": OrderState.NEW,
-        "PAYMENT": OrderState.NEW,
-        # Add other intents as needed
-    }
-    return mapping.get(intent, "NEW")  # fallback string for unmodeled intents
+    return _INITIAL_STATES.get(intent, "NEW")  # fallback string for unmodeled intents
@@ -15,6 +15,11 @@ from core.QueryExecutor import QueryExecutorSimple
 from config.utils import get_specification_list
 from pathlib import Path
 
+# TODO: Below should be from env
+# Resolved once at import instead of on every query step
+DB_DIR = Path(__file__).resolve().parent.parent / "db"
+REQUIRED_FILES = ("product.json", "specification.json")
+
 # @dataclass
 class Workstream:
     def __init__(self, phase, target: Dict[str, Any], id: str):
@@ -60,11 +65,13 @@ class Workstream:
         """
         if msg_type == ChatInfo.user_message:
             # chats = self.workstreams[ws_id].chats
+            # Plain-str keys: cheaper to hash than Enum members (whose __hash__ runs in
+            # Python) and rendered as 'user_message' rather than the enum repr in prompts
             chat_obj = {
-                            ChatInfo.chat_id: uuid.uuid4(),
-                            ChatInfo.user_message: message,
-                            ChatInfo.ai_message: None,
-                            ChatInfo.processed: []}
+                            ChatInfo.chat_id.value: str(uuid.uuid4()),
+                            ChatInfo.user_message.value: message,
+                            ChatInfo.ai_message.value: None,
+                            ChatInfo.processed.value: []}
             self.chats.append(chat_obj)
             return True
 
@@ -72,16 +79,16 @@ class Workstream:
             # chats = self.workstreams[ws_id].chats
             if not self.chats:
                 raise Exception("Cannot add AI message before a user message")
-            if ChatInfo.user_message not in self.chats[-1].keys():
+            if ChatInfo.user_message.value not in self.chats[-1]:
                 raise Exception("Cannot add AI message before a user message")
-            if ChatInfo.ai_message in self.chats[-1].keys():
-                if self.chats[-1][ChatInfo.ai_message] is None:
-                    self.chats[-1][ChatInfo.ai_message] = message
+            if ChatInfo.ai_message.value in self.chats[-1]:
+                if self.chats[-1][ChatInfo.ai_message.value] is None:
+                    self.chats[-1][ChatInfo.ai_message.value] = message
                 return True
         elif msg_type == ChatInfo.processed.value:
             if not self.chats:
                 raise Exception("Cannot add processed information before a user message")
-            if ChatInfo.processed in self.chats[-1].keys():
+            if ChatInfo.processed.value in self.chats[-1]:
                 self.chats[-1][ChatInfo.processed.value].append(message)
                 return True
         return False
@@ -141,10 +148,6 @@ class Workstream:
                     pandas_query = query_llm_output.get("pandas_query")
 
                     # Query Executor
-                    # TODO: Below should be from env
-                    from pathlib import Path
-                    DB_DIR = Path(__file__).resolve().parent.parent / "db"
-                    REQUIRED_FILES = ["product.json", "specification.json"]
                     for filename in REQUIRED_FILES:
                         path = DB_DIR / filename
                         if not path.exists():
@@ -19,7 +19,7 @@ except ImportError:
     # If flask not available, just continue
     pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """Represents an available MCP tool."""
     name: str
@@ -73,21 +73,31 @@ class MCPClient:
             # Start the server process
             self.process = subprocess.Popen(
                 self.server_command,
+                stdin=subprocess.DEVNULL,   # Server never reads stdin; don't inherit the console
                 stdout=subprocess.DEVNULL,  # Don't capture output to avoid pipe issues
                 stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0
             )
 
-            # Wait for server to start
-            time.sleep(3.0)
-
-            # Check if process is still running
-            if self.process.poll() is not None:
-                print(f"[ERROR] Server process exited with code: {self.process.returncode}")
-                return False
+            # Poll the health endpoint until the server answers instead of
+            # sleeping a fixed amount of time
+            deadline = time.monotonic() + 30.0
+            while time.monotonic() < deadline:
+                # Check if process is still running
+                if self.process.poll() is not None:
+                    print(f"[ERROR] Server process exited with code: {self.process.returncode}")
+                    return False
+                try:
+                    if requests.get(f"{self.server_url}/health", timeout=1).status_code == 200:
+                        print("[INFO] Local server process started")
+                        return True
+                except requests.exceptions.RequestException:
+                    pass
+                time.sleep(0.05)
 
-            print("[INFO] Local server process started")
-            return True
+            print("[ERROR] Local server did not become ready in time")
+            self._cleanup_process()
+            return False
 
         except Exception as e:
             print(f"[ERROR] Failed to start local server: {e}")
@@ -171,6 +181,11 @@ class MCPClient:
                 print(f"[ERROR] Tool call failed: {response.status_code} - {response.text}")
                 return None
 
+        except requests.exceptions.ConnectionError:
+            # Server went away; is_connected() reflects it without probing the process
+            print("[ERROR] Connection lost to MCP server")
+            self.connected = False
+            return None
         except Exception as e:
             print(f"[ERROR] Failed to call tool {tool_name}: {e}")
             return None
@@ -2,33 +2,61 @@ import asyncio
 import json
 from pathlib import Path
 from nlu.planner_nlu import PlannerNLU
+from core.conversation_history import ConversationHistory
+from config.enums import ChatInfo
 from dev_docs.tests.nlu.nlu_questions import questions  # Assuming questions are imported here
 import time
 
+# Upper bound on fixtures in flight at once, so a large fixture file does not hit rate limits
+MAX_CONCURRENCY = 16
+
+
+def build_history(key, value) -> ConversationHistory:
+    """
+    Seed a session from a fixture: last_intent becomes the active workstream's phase,
+    the session subcategory/order_id its target and PAST_3_USER_MESSAGES its chats.
+    The planner prompt has no slot for the remaining session_entities.
+    """
+    history = ConversationHistory(session_id=key)
+    past_messages = value.get("PAST_3_USER_MESSAGES", [])
+    if not past_messages:
+        return history
+
+    entities = value.get("session_entities", {})
+    target = {"subcategory": entities.get("subcategory"), "order_id": entities.get("order_id")}
+    ws = history.create_new_workstream(value.get("last_intent", ""), target)
+    # Workstream.__init__ is not a dataclass, so its chats start out as a Field object
+    ws.chats = []
+    for msg in past_messages:
+        ws.add_chat_in_ws(ChatInfo.user_message, msg)
+    history.update_active_ws_id(ws.get_workstream_id())
+    return history
+
+
 async def main():
     nlu = PlannerNLU()  # Initialize the nlu class
-    answers = []
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
     total_start_time = time.time()
 
-    for idx, (key, value) in enumerate(questions.items(), start=1):
-        start_time = time.time()
-
-        past_messages = []
-        for msg in value.get("PAST_3_USER_MESSAGES", []):
-            past_messages.append({"role": "user", "content": msg})
-
-        answer = await nlu.analyze_message(  # Await the asynchronous call
-            value["CURRENT_MESSAGE"],
-            past_messages,
-            value.get("last_intent", ""),
-            value.get("session_entities", {})
-        )
+    async def run_one(idx, key, value):
+        async with sem:
+            start_time = time.time()
+            # Each fixture gets its own session so concurrent runs share no state
+            answer = await nlu.run(  # Await the asynchronous call
+                user_message=value["CURRENT_MESSAGE"],
+                conversation_context=build_history(key, value)
+            )
+            elapsed_time = time.time() - start_time
+        answer = answer if isinstance(answer, dict) else {}
         answer["question"] = value["CURRENT_MESSAGE"]
         answer["question_key"] = key
-        answers.append(answer)
-
-        elapsed_time = time.time() - start_time
         print(f"Question {idx}: done ({elapsed_time:.2f}s)")
+        return answer
+
+    # Fixtures are independent, so fire them concurrently; gather keeps the input order
+    answers = await asyncio.gather(
+        *(run_one(idx, key, value) for idx, (key, value) in enumerate(questions.items(), start=1))
+    )
 
     total_time = time.time() - total_start_time
     print(f"\nTotal execution time: {total_time:.2f}s")
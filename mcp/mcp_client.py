@@ -5,18 +5,107 @@ Designed for AWS/EC2 deployment with network communication.
 """
 
 import json
+import queue
+import socket
 import requests
-import time
 import os
-from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, Iterator, Optional, List, Mapping, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
 
 # loading environment variables
 load_dotenv()
 
+# orjson is optional; it encodes/decodes request and response bodies
+# several times faster than the stdlib json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Reuse one compact encoder/decoder instead of going through json.dumps/loads,
+# and keep non-ASCII product text as UTF-8 rather than \uXXXX escapes.
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_decode = json.JSONDecoder().decode
+
+
+def _dumps(obj: Any) -> bytes:
+    # Same contract as agents.base.dump_prompt_json (kept local: this module also runs
+    # as a standalone script): non-str keys are coerced, unknown types go to stdlib json
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return _encode(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return _decode(data.decode("utf-8"))
+
+# Headers are identical for every tool call; build them once.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """urllib3 connection that talks HTTP over a UNIX domain socket."""
+
+    def __init__(self, *args, uds_path: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._uds_path = uds_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        sock.connect(self._uds_path)
+        return sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+    def __init__(self, uds_path: str, **kwargs):
+        super().__init__("localhost", **kwargs)
+        self.conn_kw["uds_path"] = uds_path
+
+
+class _UnixSocketAdapter(HTTPAdapter):
+    """Routes every request mounted on this adapter to one UNIX socket."""
+
+    def __init__(self, uds_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self._uds_path = uds_path
+        self._pool: Optional[_UnixHTTPConnectionPool] = None
+
+    def _get_pool(self) -> _UnixHTTPConnectionPool:
+        # Built on first use (and again after close()), so a closed session can reconnect
+        if self._pool is None:
+            self._pool = _UnixHTTPConnectionPool(self._uds_path, maxsize=self._pool_maxsize)
+        return self._pool
+
+    def get_connection(self, url, proxies=None):
+        return self._get_pool()
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._get_pool()
+
+    def close(self):
+        super().close()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """Represents an available MCP tool."""
     name: str
@@ -30,21 +119,46 @@ class MCPHttpClient:
     Perfect for AWS/EC2 deployment scenarios.
     """
 
-    def __init__(self, server_url: str = None, timeout: int = 30):
+    __slots__ = (
+        "server_url", "timeout", "connected", "available_tools", "_tool_names",
+        "tools", "_tool_urls", "_session", "_batch_url", "uds_path",
+    )
+
+    def __init__(self, server_url: str = None, timeout: int = 30, uds_path: str = None):
         """
         Initialize MCP HTTP client.
 
         Args:
             server_url (str): URL of the MCP server (e.g., "http://localhost:8000")
             timeout (int): Request timeout in seconds
+            uds_path (str): Optional UNIX socket of a co-located server; skips TCP entirely
         """
         self.server_url = server_url or os.getenv("MCP_SERVER_URL", "http://localhost:8000")
         self.timeout = timeout
         self.connected = False
-        self.available_tools = {}
+        # Read-only view plus a name tuple, both rebuilt only on discovery
+        self.available_tools: Mapping[str, MCPTool] = MappingProxyType({})
+        self._tool_names: Tuple[str, ...] = ()
+        # Per-tool callables bound at discovery, e.g. client.tools.sum_numbers(a=1, b=2)
+        self.tools = SimpleNamespace()
+        self._tool_urls: Dict[str, str] = {}
+        # One keep-alive session for every request, so tool calls reuse the
+        # same TCP connection instead of paying a new handshake each time.
+        self._session = requests.Session()
 
         # Remove trailing slash
         self.server_url = self.server_url.rstrip('/')
+        self._batch_url = f"{self.server_url}/tools/batch"
+
+        # Resolve proxy / CA-bundle settings from the environment once. With
+        # trust_env left on, requests re-reads them (and ~/.netrc) per call.
+        self.uds_path = uds_path or os.getenv("MCP_UDS_PATH")
+        if self.uds_path:
+            self._session.mount(self.server_url, _UnixSocketAdapter(self.uds_path))
+        else:
+            self._session.proxies.update(requests.utils.get_environ_proxies(self.server_url))
+        self._session.verify = os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE") or True
+        self._session.trust_env = False
 
     def connect(self) -> bool:
         """
@@ -57,7 +171,7 @@ class MCPHttpClient:
             print(f"[INFO] Connecting to MCP server at {self.server_url}")
 
             # Test connection with health endpoint
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/health",
                 timeout=self.timeout
             )
@@ -69,7 +183,7 @@ class MCPHttpClient:
                 self._discover_tools()
 
                 self.connected = True
-                print(f"[INFO] MCP Client connected. Available tools: {list(self.available_tools.keys())}")
+                print(f"[INFO] MCP Client connected. Available tools: {list(self._tool_names)}")
                 return True
             else:
                 print(f"[ERROR] Health check failed: HTTP {response.status_code}")
@@ -88,24 +202,32 @@ class MCPHttpClient:
     def _discover_tools(self):
         """Discover available tools from the HTTP server."""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/tools",
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 tools_data = data.get("tools", [])
 
+                tools = {}
+                callers = {}
+                self._tool_urls.clear()
                 for tool_info in tools_data:
                     tool_name = tool_info.get("name")
                     if tool_name:
-                        self.available_tools[tool_name] = MCPTool(
+                        tools[tool_name] = MCPTool(
                             name=tool_name,
                             description=tool_info.get("description", ""),
                             input_schema=tool_info.get("inputSchema", {})
                         )
+                        self._tool_urls[tool_name] = f"{self.server_url}/tools/{tool_name}"
+                        callers[tool_name] = self._make_tool_caller(tools[tool_name], self._tool_urls[tool_name])
 
+                self.available_tools = MappingProxyType(tools)
+                self._tool_names = tuple(tools)
+                self.tools = SimpleNamespace(**callers)
                 print(f"[INFO] Discovered {len(tools_data)} tools")
             else:
                 print(f"[WARN] Failed to get tools list: HTTP {response.status_code}")
@@ -124,28 +246,72 @@ class MCPHttpClient:
         Returns:
             Dict: Tool response or None if failed
         """
+        return self._decode_response(tool_name, self.call_tool_raw(tool_name, arguments))
+
+    def call_tool_raw(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Call an MCP tool via HTTP and return the undecoded response body.
+
+        Useful when the payload is only forwarded (e.g. into a prompt or another
+        service) and building the nested dicts for large results is wasted work.
+
+        Args:
+            tool_name (str): Name of the tool to call
+            arguments (Dict): Tool arguments
+
+        Returns:
+            bytes: Raw JSON response body or None if failed
+        """
         if not self.connected:
             print("[ERROR] MCP client not connected")
             return None
 
         if tool_name not in self.available_tools:
-            print(f"[ERROR] Tool '{tool_name}' not available. Available: {list(self.available_tools.keys())}")
+            print(f"[ERROR] Tool '{tool_name}' not available. Available: {list(self._tool_names)}")
             return None
 
+        return self._post_tool(tool_name, self._tool_urls[tool_name], arguments)
+
+    def _make_tool_caller(self, tool: MCPTool, url: str):
+        """Build a callable for one discovered tool with its name and URL already resolved."""
+        tool_name = tool.name
+
+        def caller(**arguments: Any) -> Optional[Dict[str, Any]]:
+            if not self.connected:
+                print("[ERROR] MCP client not connected")
+                return None
+            return self._decode_response(tool_name, self._post_tool(tool_name, url, arguments))
+
+        caller.__name__ = tool_name
+        caller.__doc__ = tool.description
+        return caller
+
+    def _decode_response(self, tool_name: str, raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Decode a raw tool response body, None if the call failed or the body is not JSON."""
+        if raw is None:
+            return None
         try:
-            response = requests.post(
-                f"{self.server_url}/tools/{tool_name}",
-                json=arguments,
+            return _loads(raw)
+        except ValueError as e:
+            print(f"[ERROR] Invalid JSON response from tool {tool_name}: {e}")
+            return None
+
+    def _post_tool(self, tool_name: str, url: str, arguments: Dict[str, Any]) -> Optional[bytes]:
+        """POST one tool call and return the raw response body or None if failed."""
+        try:
+            response = self._session.post(
+                url,
+                data=_dumps(arguments),
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                headers=_JSON_HEADERS
             )
 
             if response.status_code == 200:
-                return response.json()
+                return response.content
             else:
                 error_msg = f"HTTP {response.status_code}"
                 try:
-                    error_detail = response.json().get("detail", "Unknown error")
+                    error_detail = _loads(response.content).get("detail", "Unknown error")
                     error_msg += f": {error_detail}"
                 except:
                     error_msg += f": {response.text}"
@@ -157,16 +323,71 @@ class MCPHttpClient:
             print(f"[ERROR] Tool call timeout for {tool_name}")
             return None
         except requests.exceptions.ConnectionError:
-            print(f"[ERROR] Connection lost to MCP server")
+            print("[ERROR] Connection lost to MCP server")
             self.connected = False
             return None
         except Exception as e:
             print(f"[ERROR] Failed to call tool {tool_name}: {e}")
             return None
 
-    def get_available_tools(self) -> List[str]:
-        """Get list of available tool names."""
-        return list(self.available_tools.keys())
+    def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Call several MCP tools in a single HTTP round-trip.
+
+        Args:
+            calls (List[Tuple[str, Dict]]): (tool_name, arguments) pairs
+
+        Returns:
+            List: Tool responses in the same order as `calls`, None for each failed call
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        if not self.connected:
+            print("[ERROR] MCP client not connected")
+            return results
+
+        batch = []
+        positions = []
+        for idx, (tool_name, arguments) in enumerate(calls):
+            if tool_name not in self.available_tools:
+                print(f"[ERROR] Tool '{tool_name}' not available. Available: {list(self._tool_names)}")
+                continue
+            batch.append({"name": tool_name, "arguments": arguments})
+            positions.append(idx)
+
+        if not batch:
+            return results
+
+        try:
+            response = self._session.post(
+                self._batch_url,
+                data=_dumps(batch),
+                timeout=self.timeout,
+                headers=_JSON_HEADERS
+            )
+
+            if response.status_code != 200:
+                print(f"[ERROR] Batch tool call failed: HTTP {response.status_code}")
+                return results
+
+            for idx, item in zip(positions, _loads(response.content).get("results", [])):
+                if "error" in item:
+                    print(f"[ERROR] Tool call failed: {calls[idx][0]}: {item['error']}")
+                else:
+                    results[idx] = item.get("result")
+
+        except requests.exceptions.Timeout:
+            print("[ERROR] Batch tool call timeout")
+        except requests.exceptions.ConnectionError:
+            print("[ERROR] Connection lost to MCP server")
+            self.connected = False
+        except Exception as e:
+            print(f"[ERROR] Failed to call tools in batch: {e}")
+
+        return results
+
+    def get_available_tools(self) -> Tuple[str, ...]:
+        """Get available tool names (an immutable tuple cached at discovery)."""
+        return self._tool_names
 
     def get_tool_info(self, tool_name: str) -> Optional[MCPTool]:
         """Get information about a specific tool."""
@@ -177,14 +398,15 @@ class MCPHttpClient:
         return self.connected
 
     def disconnect(self):
-        """Disconnect from MCP server (HTTP client doesn't maintain persistent connections)."""
+        """Disconnect from MCP server and release pooled connections."""
         self.connected = False
+        self._session.close()
         print("[INFO] MCP HTTP Client disconnected")
 
     def ping(self) -> bool:
         """Ping the server to check if it's still alive."""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.server_url}/health",
                 timeout=5
             )
@@ -193,6 +415,111 @@ class MCPHttpClient:
             return False
 
 
+class MCPHttpClientPool:
+    """
+    Fixed-size pool of connected MCPHttpClient instances.
+
+    requests.Session is not thread-safe, so threads calling tools in parallel
+    each borrow their own client (and its keep-alive connection) from the pool.
+    """
+
+    __slots__ = ("size", "_clients", "_idle", "_executor", "_connected")
+
+    def __init__(self, server_url: str = None, size: int = None, timeout: int = 30, uds_path: str = None):
+        """
+        Initialize MCP HTTP client pool.
+
+        Args:
+            server_url (str): URL of the MCP server (e.g., "http://localhost:8000")
+            size (int): Number of clients in the pool, defaults to the CPU count
+            timeout (int): Request timeout in seconds
+            uds_path (str): Optional UNIX socket of a co-located server
+        """
+        self.size = size or os.cpu_count() or 4
+        self._clients = [
+            MCPHttpClient(server_url=server_url, timeout=timeout, uds_path=uds_path)
+            for _ in range(self.size)
+        ]
+        self._idle: "queue.SimpleQueue[MCPHttpClient]" = queue.SimpleQueue()
+        self._connected = False
+        # Created per connect() and shut down by disconnect(), so the pool can be reused
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def connect(self) -> bool:
+        """
+        Connect every client in the pool.
+
+        Returns:
+            bool: True if all clients connected successfully
+        """
+        if self._connected:
+            return True
+        results = [client.connect() for client in self._clients]
+        if not all(results):
+            for client in self._clients:
+                client.disconnect()
+            return False
+        for client in self._clients:
+            self._idle.put(client)
+        # One worker per client, so a submitted call never waits for an idle client
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="mcp-call")
+        self._connected = True
+        return True
+
+    @contextmanager
+    def _borrow(self) -> Iterator[MCPHttpClient]:
+        """Take an idle client for the duration of one call."""
+        if not self._connected:
+            raise RuntimeError("MCP client pool not connected; call connect() first")
+        client = self._idle.get()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Call an MCP tool on an idle pooled client."""
+        with self._borrow() as client:
+            return client.call_tool(tool_name, arguments)
+
+    def call_tool_raw(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[bytes]:
+        """Call an MCP tool on an idle pooled client and return the raw body."""
+        with self._borrow() as client:
+            return client.call_tool_raw(tool_name, arguments)
+
+    def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Call several MCP tools in one round-trip on an idle pooled client."""
+        with self._borrow() as client:
+            return client.call_tools(calls)
+
+    def submit_tool(self, tool_name: str, arguments: Dict[str, Any]) -> "Future[Optional[Dict[str, Any]]]":
+        """
+        Start an MCP tool call in the background.
+
+        Args:
+            tool_name (str): Name of the tool to call
+            arguments (Dict): Tool arguments
+
+        Returns:
+            Future: Resolves to the tool response (None if failed); combine several
+                with concurrent.futures.wait / as_completed
+        """
+        if self._executor is None:
+            raise RuntimeError("MCP client pool not connected; call connect() first")
+        return self._executor.submit(self.call_tool, tool_name, arguments)
+
+    def disconnect(self):
+        """Disconnect every client in the pool."""
+        self._connected = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for client in self._clients:
+            client.disconnect()
+
+
 def test_mcp_http_client():
     """Test the HTTP MCP client with your server."""
     print("🧪 Testing HTTP MCP Client")
@@ -217,32 +544,32 @@ def test_mcp_http_client():
             # Test each tool
             print("\n🔧 Testing tools:")
 
-            # Test health tool
-            health_result = client.call_tool("health", {})
+            # Test health, echo and sum_numbers in one batched request
+            health_result, echo_result, sum_result = client.call_tools([
+                ("health", {}),
+                ("echo", {"data": {"test": "Hello from HTTP MCP client!", "number": 42}}),
+                ("sum_numbers", {"a": 15.5, "b": 24.7}),
+            ])
             print(f"   Health: {health_result}")
-
-            # Test echo tool
-            echo_result = client.call_tool("echo", {
-                "data": {"test": "Hello from HTTP MCP client!", "number": 42}
-            })
             print(f"   Echo: {echo_result}")
-
-            # Test sum_numbers tool
-            sum_result = client.call_tool("sum_numbers", {
-                "a": 15.5,
-                "b": 24.7
-            })
             print(f"   Sum: {sum_result}")
 
-            # Test product search
-            search_result = client.call_tool("search_products", {
-                "category": "electronics",
-                "subcategory": "laptop",
-                "budget_max": 1000.0,
-                "specifications": ["intel", "8gb"]
-            })
+            # Test product search through its bound per-tool caller
+            search_result = client.tools.search_products(
+                category="electronics",
+                subcategory="laptop",
+                budget_max=1000.0,
+                specifications=["intel", "8gb"]
+            )
             print(f"   Product Search: {search_result}")
 
+            # Reconnecting after disconnect() must reuse the same client
+            client.disconnect()
+            if client.connect() and client.ping():
+                print("✅ Reconnected after disconnect")
+            else:
+                print("❌ Failed to reconnect after disconnect")
+
             print("\n✅ All tool tests completed!")
 
         else:
@@ -266,6 +593,9 @@ MCP_SERVER_URL=http://localhost:8000
 MCP_HOST=0.0.0.0
 MCP_PORT=8000
 
+# Same-host deployment: serve and connect over a UNIX socket instead of TCP
+# MCP_UDS_PATH=/tmp/mcp.sock
+
 # For AWS deployment, update to:
 # MCP_SERVER_URL=http://your-ec2-server-ip:8000
 # or
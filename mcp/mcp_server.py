@@ -8,11 +8,15 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 import sys
 import json
+import logging
 import time
 import os
 import uvicorn
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple, Type
+
+# Per-call tool traces go through logging so they cost nothing unless enabled
+logger = logging.getLogger(__name__)
 
 # ---------------------------
 # Input/Output Models
@@ -76,6 +80,12 @@ class OrderStatusOutput(BaseModel):
     estimated_delivery: Optional[str] = Field(description="Estimated delivery date")
 
 
+class ToolCallRequest(BaseModel):
+    """One entry of a batch tool call."""
+    name: str = Field(description="Tool name")
+    arguments: Dict[str, Any] = Field(description="Tool arguments", default_factory=dict)
+
+
 # ---------------------------
 # Simple HTTP Server Setup
 # ---------------------------
@@ -88,15 +98,21 @@ app = FastAPI(title="Ecommerce MCP Server", description="Simple HTTP-based MCP t
 
 # Tool registry for MCP compatibility
 AVAILABLE_TOOLS = []
+# Name -> (handler, input model or None for argument-less tools) so each call
+# resolves and dispatches its tool in O(1)
+TOOL_DISPATCH: Dict[str, Tuple[Callable[..., BaseModel], Optional[Type[BaseModel]]]] = {}
 
-def register_tool(name: str, description: str, input_schema: dict, handler):
+def register_tool(name: str, description: str, input_schema: dict, handler,
+                  input_model: Optional[Type[BaseModel]] = None):
     """Register a tool for MCP compatibility"""
-    AVAILABLE_TOOLS.append({
+    tool = {
         "name": name,
         "description": description,
         "inputSchema": input_schema,
         "handler": handler
-    })
+    }
+    AVAILABLE_TOOLS.append(tool)
+    TOOL_DISPATCH[name] = (handler, input_model)
 
 # ---------------------------
 # Basic Tools
@@ -104,7 +120,7 @@ def register_tool(name: str, description: str, input_schema: dict, handler):
 
 def echo_handler(input_data: EchoInput) -> EchoOutput:
     """Echo back the input data with server information."""
-    print(f"CALLED: echo() with data keys: {list(input_data.data.keys())}")
+    logger.info("CALLED: echo() with data keys: %s", list(input_data.data))
     return EchoOutput(
         echo=input_data.data,
         server_info=f"EcommerceMCPServer at {datetime.now().isoformat()}"
@@ -112,17 +128,19 @@ def echo_handler(input_data: EchoInput) -> EchoOutput:
 
 def health_handler() -> HealthOutput:
     """Return the health status of the ecommerce MCP server."""
-    print("CALLED: health() -> HealthOutput")
-    uptime = (datetime.now() - SERVER_START_TIME).total_seconds()
+    logger.info("CALLED: health() -> HealthOutput")
+    # Read the clock once so timestamp and uptime agree
+    now = datetime.now()
+    uptime = (now - SERVER_START_TIME).total_seconds()
     return HealthOutput(
         status="healthy",
-        timestamp=datetime.now().isoformat(),
+        timestamp=now.isoformat(),
         uptime_seconds=uptime
     )
 
 def sum_numbers_handler(input_data: SumInput) -> SumOutput:
     """Calculate the sum of two numbers."""
-    print(f"CALLED: sum_numbers({input_data.a}, {input_data.b}) -> SumOutput")
+    logger.info("CALLED: sum_numbers(%s, %s) -> SumOutput", input_data.a, input_data.b)
     result = input_data.a + input_data.b
     return SumOutput(
         result=result,
@@ -130,69 +148,99 @@ def sum_numbers_handler(input_data: SumInput) -> SumOutput:
     )
 
 # Register basic tools
-register_tool("echo", "Echo back the input data", {"type": "object", "properties": {"data": {"type": "object"}}}, echo_handler)
+register_tool("echo", "Echo back the input data", {"type": "object", "properties": {"data": {"type": "object"}}}, echo_handler, EchoInput)
 register_tool("health", "Get server health status", {"type": "object", "properties": {}}, health_handler)
-register_tool("sum_numbers", "Calculate sum of two numbers", {"type": "object", "properties": {"a": {"type": "number"}, "b": {"type": "number"}}}, sum_numbers_handler)
+register_tool("sum_numbers", "Calculate sum of two numbers", {"type": "object", "properties": {"a": {"type": "number"}, "b": {"type": "number"}}}, sum_numbers_handler, SumInput)
 
 
 # ---------------------------
 # Ecommerce Specific Tools
 # ---------------------------
 
+# Mock product database (static, so built once at import rather than per call)
+MOCK_PRODUCTS = {
+    "electronics": [
+        {
+            "id": "laptop_001",
+            "name": "Dell Inspiron 15",
+            "price": 899.99,
+            "category": "electronics",
+            "subcategory": "laptop",
+            "specifications": ["Intel i5", "8GB RAM", "256GB SSD", "15.6 inch"],
+            "rating": 4.3,
+            "availability": "in_stock"
+        },
+        {
+            "id": "laptop_002",
+            "name": "MacBook Air M2",
+            "price": 1299.99,
+            "category": "electronics",
+            "subcategory": "laptop",
+            "specifications": ["Apple M2", "8GB RAM", "256GB SSD", "13.3 inch"],
+            "rating": 4.7,
+            "availability": "in_stock"
+        },
+        {
+            "id": "phone_001",
+            "name": "iPhone 15",
+            "price": 799.99,
+            "category": "electronics",
+            "subcategory": "smartphone",
+            "specifications": ["A17 chip", "128GB storage", "6.1 inch display"],
+            "rating": 4.5,
+            "availability": "in_stock"
+        }
+    ],
+    "sports": [
+        {
+            "id": "shoes_001",
+            "name": "Nike Air Max",
+            "price": 129.99,
+            "category": "sports",
+            "subcategory": "shoes",
+            "specifications": ["size 10", "running", "mesh upper"],
+            "rating": 4.2,
+            "availability": "in_stock"
+        }
+    ]
+}
+
+# Lowercased, space-joined specifications per product id for the spec filter
+PRODUCT_SPEC_TEXT = {
+    product["id"]: " ".join(product.get("specifications", [])).lower()
+    for products in MOCK_PRODUCTS.values()
+    for product in products
+}
+
+# Mock order database
+MOCK_ORDERS = {
+    "ORD001": {
+        "status": "shipped",
+        "tracking_number": "TRK123456789",
+        "estimated_delivery": "2024-12-30",
+        "current_location": "Distribution Center - Chicago"
+    },
+    "ORD002": {
+        "status": "processing",
+        "tracking_number": None,
+        "estimated_delivery": "2024-12-28",
+        "current_location": "Fulfillment Center"
+    },
+    "12345": {
+        "status": "delivered",
+        "tracking_number": "TRK987654321",
+        "estimated_delivery": "2024-12-25",
+        "current_location": "Delivered to doorstep"
+    }
+}
+
+
 def search_products_handler(input_data: ProductSearchInput) -> ProductSearchOutput:
     """Search for products based on category, budget, and specifications."""
-    print(f"CALLED: search_products() category={input_data.category}, budget_max={input_data.budget_max}")
-
-    # Mock product database
-    mock_products = {
-        "electronics": [
-            {
-                "id": "laptop_001",
-                "name": "Dell Inspiron 15",
-                "price": 899.99,
-                "category": "electronics",
-                "subcategory": "laptop",
-                "specifications": ["Intel i5", "8GB RAM", "256GB SSD", "15.6 inch"],
-                "rating": 4.3,
-                "availability": "in_stock"
-            },
-            {
-                "id": "laptop_002",
-                "name": "MacBook Air M2",
-                "price": 1299.99,
-                "category": "electronics",
-                "subcategory": "laptop",
-                "specifications": ["Apple M2", "8GB RAM", "256GB SSD", "13.3 inch"],
-                "rating": 4.7,
-                "availability": "in_stock"
-            },
-            {
-                "id": "phone_001",
-                "name": "iPhone 15",
-                "price": 799.99,
-                "category": "electronics",
-                "subcategory": "smartphone",
-                "specifications": ["A17 chip", "128GB storage", "6.1 inch display"],
-                "rating": 4.5,
-                "availability": "in_stock"
-            }
-        ],
-        "sports": [
-            {
-                "id": "shoes_001",
-                "name": "Nike Air Max",
-                "price": 129.99,
-                "category": "sports",
-                "subcategory": "shoes",
-                "specifications": ["size 10", "running", "mesh upper"],
-                "rating": 4.2,
-                "availability": "in_stock"
-            }
-        ]
-    }
+    logger.info("CALLED: search_products() category=%s, budget_max=%s", input_data.category, input_data.budget_max)
 
     # Filter products
-    products = mock_products.get(input_data.category, [])
+    products = MOCK_PRODUCTS.get(input_data.category, [])
 
     # Filter by subcategory
     if input_data.subcategory:
@@ -204,10 +252,12 @@ def search_products_handler(input_data: ProductSearchInput) -> ProductSearchOutp
 
     # Filter by specifications (simple contains check)
     if input_data.specifications:
+        # Lowercase the requested specs once per request, not once per product
+        wanted_specs = [spec.lower() for spec in input_data.specifications]
         filtered_products = []
         for product in products:
-            product_specs = product.get("specifications", [])
-            if any(spec.lower() in " ".join(product_specs).lower() for spec in input_data.specifications):
+            product_spec_text = PRODUCT_SPEC_TEXT[product["id"]]
+            if any(spec in product_spec_text for spec in wanted_specs):
                 filtered_products.append(product)
         products = filtered_products
 
@@ -228,31 +278,9 @@ def search_products_handler(input_data: ProductSearchInput) -> ProductSearchOutp
 
 def check_order_status_handler(input_data: OrderStatusInput) -> OrderStatusOutput:
     """Check the status of an order by order ID."""
-    print(f"CALLED: check_order_status() order_id={input_data.order_id}")
-
-    # Mock order database
-    mock_orders = {
-        "ORD001": {
-            "status": "shipped",
-            "tracking_number": "TRK123456789",
-            "estimated_delivery": "2024-12-30",
-            "current_location": "Distribution Center - Chicago"
-        },
-        "ORD002": {
-            "status": "processing",
-            "tracking_number": None,
-            "estimated_delivery": "2024-12-28",
-            "current_location": "Fulfillment Center"
-        },
-        "12345": {
-            "status": "delivered",
-            "tracking_number": "TRK987654321",
-            "estimated_delivery": "2024-12-25",
-            "current_location": "Delivered to doorstep"
-        }
-    }
+    logger.info("CALLED: check_order_status() order_id=%s", input_data.order_id)
 
-    order_info = mock_orders.get(input_data.order_id)
+    order_info = MOCK_ORDERS.get(input_data.order_id)
 
     if not order_info:
         return OrderStatusOutput(
@@ -276,8 +304,8 @@ def check_order_status_handler(input_data: OrderStatusInput) -> OrderStatusOutpu
     )
 
 # Register ecommerce tools
-register_tool("search_products", "Search for products", {"type": "object"}, search_products_handler)
-register_tool("check_order_status", "Check order status", {"type": "object"}, check_order_status_handler)
+register_tool("search_products", "Search for products", {"type": "object"}, search_products_handler, ProductSearchInput)
+register_tool("check_order_status", "Check order status", {"type": "object"}, check_order_status_handler, OrderStatusInput)
 
 
 # ---------------------------
@@ -295,51 +323,61 @@ async def list_tools():
     """List available tools (MCP compatible)"""
     return {"tools": AVAILABLE_TOOLS}
 
-@app.post("/tools/{tool_name}")
-async def call_tool(tool_name: str, arguments: dict):
-    """Call a specific tool"""
+def _run_tool(tool_name: str, arguments: dict) -> dict:
+    """Run a registered tool and return its output as a plain dict."""
     # Find the tool
-    tool = None
-    for t in AVAILABLE_TOOLS:
-        if t["name"] == tool_name:
-            tool = t
-            break
-
-    if not tool:
+    dispatch = TOOL_DISPATCH.get(tool_name)
+    if not dispatch:
         raise HTTPException(status_code=404, detail=f"Tool {tool_name} not found")
 
     try:
-        # Call the handler based on tool name
-        if tool_name == "echo":
-            result = echo_handler(EchoInput(**arguments))
-        elif tool_name == "health":
-            result = health_handler()
-        elif tool_name == "sum_numbers":
-            result = sum_numbers_handler(SumInput(**arguments))
-        elif tool_name == "search_products":
-            result = search_products_handler(ProductSearchInput(**arguments))
-        elif tool_name == "check_order_status":
-            result = check_order_status_handler(OrderStatusInput(**arguments))
-        else:
-            raise HTTPException(status_code=404, detail=f"Handler for {tool_name} not implemented")
+        # Validate arguments with the tool's input model (if any) and call its handler
+        handler, input_model = dispatch
+        result = handler(input_model(**arguments)) if input_model else handler()
 
         return result.dict()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+
+# Declared before /tools/{tool_name} so "batch" is not taken as a tool name.
+@app.post("/tools/batch")
+async def call_tools_batch(calls: List[ToolCallRequest]):
+    """Call several tools in one request. Results keep the order of the calls."""
+    results = []
+    for call in calls:
+        try:
+            results.append({"result": _run_tool(call.name, call.arguments)})
+        except HTTPException as e:
+            results.append({"error": e.detail})
+    return {"results": results}
+
+@app.post("/tools/{tool_name}")
+async def call_tool(tool_name: str, arguments: dict):
+    """Call a specific tool"""
+    return _run_tool(tool_name, arguments)
+
 # ---------------------------
 # Main Entry Point
 # ---------------------------
 
 if __name__ == "__main__":
+    # Keep the tool-call traces visible when run directly
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🚀 Simple HTTP-based MCP Server starting...")
     print("🛠️  Available tools: echo, health, sum_numbers, search_products, check_order_status")
 
     host = os.environ.get("MCP_HOST", "127.0.0.1")
     port = int(os.environ.get("MCP_PORT", "8000"))
-
-    print(f"🌐 Running HTTP server on {host}:{port}")
-    print(f"📡 Health endpoint: http://{host}:{port}/health")
-    print(f"🛠️  Tools endpoint: http://{host}:{port}/tools")
-
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    uds_path = os.environ.get("MCP_UDS_PATH")
+
+    if uds_path:
+        # Same-host clients skip the TCP stack entirely
+        print(f"🌐 Running HTTP server on unix socket {uds_path}")
+        uvicorn.run(app, uds=uds_path, log_level="info")
+    else:
+        print(f"🌐 Running HTTP server on {host}:{port}")
+        print(f"📡 Health endpoint: http://{host}:{port}/health")
+        print(f"🛠️  Tools endpoint: http://{host}:{port}/tools")
+
+        uvicorn.run(app, host=host, port=port, log_level="info")
@@ -3,12 +3,43 @@
 from typing import Dict, List, Optional, Any
 from core.llm_client import LLMClient
 from config.enums import ModelType
+from agents.base import decode_first_json
 from prompts.DiscoveryEntityExtractionPrompt import SYSTEM_PROMPT_ENTITY_EXTRACTION
 import os
 import json
 import re
 
+# Compiled once; extract_json_list runs on every entity-extraction response
+_JSON_FENCE_RE = re.compile(r"```json", flags=re.IGNORECASE)
+_FENCE_RE = re.compile(r"```")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+_TRAILING_COMMA_RE = re.compile(r",\s*(\}|\])")
+_BARE_KEY_RE = re.compile(r"(\w+)\s*:")
+_DECODER = json.JSONDecoder()
+
+
+def build_spec_prompt_prefix(subcategory, specification_list: List[Dict[str, Any]]) -> str:
+    """Product/spec block of the entity-extraction user prompt (everything before the question)."""
+    lines = ["Input:", f"Product: {subcategory}", "Available specs:"]
+    # One pass over the specs builds both the spec lines and the lowercase key list
+    spec_list_label = []
+    for obj in specification_list:
+        label = obj['spec_name_label']
+        spec_list_label.append(label.lower())
+        str_ = f"\t- {label}: datatype={obj['data_type']}, "
+        if obj["unit"] is not None:
+            str_ += f"unit - {obj['unit']}. "
+            str_ += f"example - **{obj['spec_value']} {obj['unit']}."
+        else:
+            str_ += f"example - {obj['spec_value']}."
+        lines.append(str_)
+    lines.append(f"Note: Use lowercase keys exactly as listed (e.g. {', '.join(spec_list_label)}) ")
+    return "\n".join(lines) + "\n"
+
+
 class DiscoveryNLU:
+    __slots__ = ("llm_client", "user_prompt", "system_prompt", "subcategory", "specification_list", "_prompt_prefix")
 
     def __init__(self, subcategory, specification_list, llm_client: Optional[LLMClient] = None):
         self.llm_client = llm_client or LLMClient(model_type=os.getenv("MODEL_TYPE", ModelType.openai))
@@ -16,24 +47,14 @@ class DiscoveryNLU:
         self.system_prompt: str = SYSTEM_PROMPT_ENTITY_EXTRACTION
         self.subcategory = subcategory
         self.specification_list: List[Dict[str, Any]] = specification_list
+        # Product/spec part of the prompt only depends on the constructor args
+        self._prompt_prefix: str = self._build_prompt_prefix()
+
+    def _build_prompt_prefix(self) -> str:
+        return build_spec_prompt_prefix(self.subcategory, self.specification_list)
 
     async def get_user_prompt(self, question):
-        user_prompt = "Input:\n"
-        user_prompt += f"Product: {self.subcategory}\n"
-        user_prompt += "Available specs:\n"
-        spec_list_label = [spec["spec_name_label"].lower() for spec in self.specification_list]
-        for obj in self.specification_list:
-            str_ = ""
-            str_ += f"\t- {obj['spec_name_label']}: datatype={obj['data_type']}, "
-            if obj["unit"] is not None:
-                str_ += f"unit - {obj['unit']}. "
-                str_ += f"example - **{obj['spec_value']} {obj['unit']}."
-            else:
-                str_ += f"example - {obj['spec_value']}."
-            user_prompt += str_ + "\n"
-        user_prompt += f"Note: Use lowercase keys exactly as listed (e.g. {', '.join(spec_list_label)}) \n"
-        user_prompt += f"\nuser prompt - {question}"
-        return user_prompt
+        return f"{self._prompt_prefix}\nuser prompt - {question}"
 
     # ------------------------------------------------------------
     # CLEAN RAW RESPONSE
@@ -47,32 +68,37 @@ class DiscoveryNLU:
             return []
 
         # 1. Remove markdown code fences
-        response = re.sub(r"```json", "", response, flags=re.IGNORECASE)
-        response = re.sub(r"```", "", response).strip()
+        response = _JSON_FENCE_RE.sub("", response)
+        response = _FENCE_RE.sub("", response).strip()
+
+        # Fast path: a well-formed array decodes in place, prose around it is ignored
+        parsed = decode_first_json(response, "[")
+        if parsed is not None:
+            return parsed
 
         # 2. Try to extract a JSON array first: [...stuff...]
-        list_match = re.search(r"\[[\s\S]*\]", response)
+        list_match = _JSON_ARRAY_RE.search(response)
         if list_match:
             json_str = list_match.group(0)
         else:
             # fallback: extract single object and wrap it as list
-            obj_match = re.search(r"\{[\s\S]*\}", response)
+            obj_match = _JSON_OBJECT_RE.search(response)
             if not obj_match:
                 return []
             json_str = f"[{obj_match.group(0)}]"
 
         # 3. Fix trailing commas (LLM common issue)
-        json_str = re.sub(r",\s*(\}|\])", r"\1", json_str)
+        json_str = _TRAILING_COMMA_RE.sub(r"\1", json_str)
 
         # 4. Load JSON safely
         try:
-            return json.loads(json_str)
+            return _DECODER.decode(json_str)
         except Exception:
             # last fallback: repair missing quotes around keys
-            repaired = re.sub(r"(\w+)\s*:", r'"\1":', json_str)
-            repaired = re.sub(r",\s*(\}|\])", r"\1", repaired)
+            repaired = _BARE_KEY_RE.sub(r'"\1":', json_str)
+            repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
             try:
-                return json.loads(repaired)
+                return _DECODER.decode(repaired)
             except Exception:
                 return []
 
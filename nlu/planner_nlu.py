@@ -7,10 +7,37 @@ from typing import Dict, Any, List, Optional
 from core.llm_client import LLMClient
 from prompts.PlannerPrompt import SYSTEM_PROMPT
 from core.conversation_history import ConversationHistory
-from config.enums import ChatInfo, ConverstionVars, ModelType
+from config.enums import Agents, ChatInfo, ConverstionVars, ModelType, WorkflowContinuityDecision
+from agents.base import decode_first_json, dump_prompt_json
+
+# Compiled once; clean_raw_response runs on every planner turn
+_JSON_FENCE_RE = re.compile(r"```json", flags=re.IGNORECASE)
+_FENCE_RE = re.compile(r"```")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_LOOSE_KEY_RE = re.compile(r"(['\"])?(\w+)(['\"])?\s*:")
+_DECODER = json.JSONDecoder()
+# The planner prompt's input format only has the message text per turn; chat ids and
+# processed payloads (DataFrames etc.) would make the history block large and unstable
+_HISTORY_KEYS = (ChatInfo.user_message.value, ChatInfo.ai_message.value)
+# Bare greetings/thanks are CHITCHAT that keeps the active workstream; these turns skip
+# the LLM round-trip. Acknowledgements ("yes", "ok", ...) may answer a pending question
+# and are left to the LLM.
+_CHITCHAT_FASTPATH_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you)[\s.!]*$", flags=re.IGNORECASE
+)
+
+
+def _clip_message(text: Any, max_chars: int) -> Any:
+    # Routing only needs enough of a past turn to recognise its target; a long pasted
+    # block or product listing would otherwise dominate the prompt on every later turn
+    if isinstance(text, str) and len(text) > max_chars:
+        return text[:max_chars] + "…"
+    return text
 
 
 class PlannerNLU:
+    __slots__ = ("llm_client",)
+
     def __init__(self, llm_client: Optional[LLMClient] = None):
         self.llm_client = llm_client or LLMClient(model_type=os.getenv("MODEL_TYPE", ModelType.openai))
 
@@ -18,22 +45,32 @@ class PlannerNLU:
         all_ws = conversation_history.get_all_workstreams()
         active_ws = conversation_history.get_active_workstream()
 
+        max_turns = int(ConverstionVars.max_turns)
+        max_chars = int(ConverstionVars.max_history_chars)
         past_5_turns_all_ws = {}
         for ws_id, ws in all_ws.items():
             chats = ws.get_chats()
-            past_5_turns_all_ws[ws_id] = chats[-int(ConverstionVars.max_turns):] if chats else []
+            past_5_turns_all_ws[ws_id] = [
+                {k: _clip_message(chat[k], max_chars) for k in _HISTORY_KEYS if k in chat}
+                for chat in chats[-max_turns:]
+            ]
 
+        # The active workstream is one of all_ws; reuse its slice instead of re-slicing
         active_ws_turns = {
             "active_workstream_id": active_ws.id if active_ws else None,
-            "past_5_turns": active_ws.get_chats()[-int(ConverstionVars.max_turns):] if active_ws else []
+            "past_5_turns": past_5_turns_all_ws.get(active_ws.id, []) if active_ws else []
         }
 
+        # Slowest-changing data first and the new message last, so consecutive turns share
+        # the longest possible prompt prefix (provider prefix caching)
         input_dict = {
-            "CURRENT_MESSAGE": current_msg,
+            "SESSION_WORKSTREAMS": past_5_turns_all_ws,
             "ACTIVE_WORKSTREAM_PAST_5_TURNS": active_ws_turns,
-            "SESSION_WORKSTREAMS": past_5_turns_all_ws
+            "CURRENT_MESSAGE": current_msg
         }
-        return str(input_dict)
+        # JSON as documented in the planner prompt; unlike str(), quoting does not flip
+        # with the message content, so identical history renders byte-identically
+        return dump_prompt_json(input_dict)
 
     # ------------------------------------------------------------
     # CLEAN RAW RESPONSE
@@ -52,8 +89,14 @@ class PlannerNLU:
             return {}
 
         # Remove markdown fences
-        response = re.sub(r"```json", "", response, flags=re.IGNORECASE).strip()
-        response = re.sub(r"```", "", response).strip()
+        response = _JSON_FENCE_RE.sub("", response).strip()
+        response = _FENCE_RE.sub("", response).strip()
+
+        # Fast path: decode the first well-formed JSON object in place (prose before or
+        # after it is ignored); only malformed output needs the repairs below
+        parsed = decode_first_json(response)
+        if parsed is not None:
+            return parsed
 
         # Extract JSON substring using first '{' and last '}'
         try:
@@ -64,22 +107,50 @@ class PlannerNLU:
             return {}
 
         # Remove trailing commas inside objects or arrays
-        json_str = re.sub(r",\s*([}\]])", r"\1", json_str)
+        json_str = _TRAILING_COMMA_RE.sub(r"\1", json_str)
 
         # Remove weird escape sequences that LLM sometimes introduces
         json_str = json_str.replace("\n", "").replace("\t", "").replace("\\", "")
 
         # Try JSON load
         try:
-            return json.loads(json_str)
+            return _DECODER.decode(json_str)
         except Exception:
             try:
                 # last fallback – try to repair common missing quotes & parse again
-                json_str = re.sub(r"(['\"])?(\w+)(['\"])?\s*:", r'"\2":', json_str)
-                return json.loads(json_str)
+                json_str = _LOOSE_KEY_RE.sub(r'"\2":', json_str)
+                return _DECODER.decode(json_str)
             except Exception:
                 return {}
 
+    # ------------------------------------------------------------
+    # FAST PATH
+    # ------------------------------------------------------------
+    @staticmethod
+    def fastpath_decision(user_message: str, conversation_context: ConversationHistory) -> Optional[Dict[str, Any]]:
+        """
+        Planner output for turns that need no LLM (see _CHITCHAT_FASTPATH_RE), else None.
+        """
+        active_ws = conversation_context.get_active_workstream()
+        if active_ws is None or not _CHITCHAT_FASTPATH_RE.match(user_message):
+            return None
+
+        return {
+            "phase": Agents.CHITCHAT.value,
+            "phase_confidence": 0.95,
+            "entities": {
+                "subcategory": [],
+                "order_id": []
+            },
+            "decision": {
+                "new_workstreams": [],
+                "active_workflow_continuity": WorkflowContinuityDecision.CONTINUATION.value,
+                "focus_workstream_id": active_ws.id
+            },
+            "reason": "Greeting/thanks with an active workstream; continuing it.",
+            "source": "fastpath"
+        }
+
     # ------------------------------------------------------------
     # RUN
     # ------------------------------------------------------------
@@ -88,6 +159,10 @@ class PlannerNLU:
         Call the Planner LLM and return cleaned JSON planner output.
         """
 
+        fastpath = self.fastpath_decision(user_message, conversation_context)
+        if fastpath is not None:
+            return fastpath
+
         user_prompt = await self.get_user_prompt(user_message, conversation_context)
 
         try:
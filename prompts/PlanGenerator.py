@@ -25,9 +25,9 @@ agent_info = get_agent_info()
 chk = 1
 
 
-def get_discovery_plan_generator_prompt() -> str:
-    """ Returns the prompt template for the Plan Generator. """
-    prompt_template = f'''You are a Plan Generator. You will receive a current user query and the last 10 turns of conversation history. Your task is to create a step-by-step sequential plan that specifies which agents to use to answer the query. The plan must always be logical, minimal, and efficient.
+# Only depends on the agent registry, which is fixed at import; build the prompt once
+# instead of re-running the f-string for every PlanGenerator.
+_DISCOVERY_PLAN_GENERATOR_PROMPT = f'''You are a Plan Generator. You will receive a current user query and the last 10 turns of conversation history. Your task is to create a step-by-step sequential plan that specifies which agents to use to answer the query. The plan must always be logical, minimal, and efficient.
 
     **Available Agents:**
         - ENTITY_EXTRACTION: Extracts structured filters from natural language.
@@ -206,4 +206,8 @@ def get_discovery_plan_generator_prompt() -> str:
           
     **End of Examples**
     '''
-    return prompt_template
\ No newline at end of file
+
+
+def get_discovery_plan_generator_prompt() -> str:
+    """ Returns the prompt template for the Plan Generator. """
+    return _DISCOVERY_PLAN_GENERATOR_PROMPT
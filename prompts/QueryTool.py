@@ -2,22 +2,10 @@ from config.constants import SPECIFICATIONS
 import json
 from config.enums import ChatInfo
 
-async def get_system_prompt_query_tool(category: str, specification_list) -> str:
-    spec_text = ""
-    # spec_list_label = [spec["spec_name_label"].lower() for spec in specification_list]
-    for obj in specification_list:
-        str_ = ""
-        str_ += f"\t- {obj['spec_name_label']}: datatype={obj['data_type']}, "
-        if obj["unit"] is not None:
-            str_ += f"unit - {obj['unit']}. "
-            str_ += f"example - {obj['spec_value']} {obj['unit']}."
-        else:
-            str_ += f"example - {obj['spec_value']}."
-        spec_text += str_ + "\n"
-
-    # spec_dict = {category: SPECIFICATIONS.get(category, [])} if category in SPECIFICATIONS else SPECIFICATIONS
-    # specs_json = json.dumps(spec_dict, indent=2)
-    SYSTEM_PROMPT_QUERY_TOOL = f"""You are a specialized AI assistant that generates executable pandas queries for an e-commerce database. Your task is to convert natural language queries into valid pandas DataFrame operations.
+# The instructions and schema are the same on every call, so they form a byte-stable
+# prefix the provider's prompt cache can reuse; only the per-subcategory specification
+# block below varies and is therefore appended last.
+_STATIC_PROMPT_QUERY_TOOL = f"""You are a specialized AI assistant that generates executable pandas queries for an e-commerce database. Your task is to convert natural language queries into valid pandas DataFrame operations.
 
 ## Database Schema Overview
 
@@ -115,15 +103,6 @@ You will receive:
   
 ```
 
-## Specifications by Subcategory
-
-Only use specifications that are valid for the current subcategory:
-
-## SPECIFICATIONS (allowed spec keys per subcategory)
-```
-{spec_text}
-```
-
 ## Query Generation Rules
 
 1. **DataFrame Naming Convention**: All DataFrames are prefixed with `df_` followed by the table name
@@ -482,4 +461,30 @@ Before returning your response, verify:
 - [ ] Reasoning clearly explains the query construction logic
 
 """
-    return SYSTEM_PROMPT_QUERY_TOOL
+
+
+async def get_system_prompt_query_tool(category: str, specification_list) -> str:
+    spec_text = ""
+    # spec_list_label = [spec["spec_name_label"].lower() for spec in specification_list]
+    for obj in specification_list:
+        str_ = ""
+        str_ += f"\t- {obj['spec_name_label']}: datatype={obj['data_type']}, "
+        if obj["unit"] is not None:
+            str_ += f"unit - {obj['unit']}. "
+            str_ += f"example - {obj['spec_value']} {obj['unit']}."
+        else:
+            str_ += f"example - {obj['spec_value']}."
+        spec_text += str_ + "\n"
+
+    # spec_dict = {category: SPECIFICATIONS.get(category, [])} if category in SPECIFICATIONS else SPECIFICATIONS
+    # specs_json = json.dumps(spec_dict, indent=2)
+    return f"""{_STATIC_PROMPT_QUERY_TOOL}## Specifications by Subcategory
+
+Only use specifications that are valid for the current subcategory:
+
+## SPECIFICATIONS (allowed spec keys per subcategory)
+```
+{spec_text}
+```
+
+"""
@@ -79,5 +79,4 @@ class PlannerAgent:
                     if focus_workstream_id is None and idx == 0:
                         # Make first new workstream created as the active one.
                         self.conversation_history.update_active_ws_id(new_ws.get_workstream_id(), is_completed=False)
-                        self.conversation_history.active_ws_id = new_ws.id
                 return
\ No newline at end of file
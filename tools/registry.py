@@ -1,8 +1,8 @@
 from config.enums import PlanGeneratorAgents as DPA
 from config.enums import ToolNames as TN
 
-DISCOVERY_WS_AGENT_NAMES = [DPA.ENTITY_EXTRACTION.value, DPA.QUERY_BUILDER_EXECUTOR.value, DPA.SUMMARIZER.value]
-DISCOVERY_WS_TOOLS_NAMES = [TN.GET_ALL_BRANDS_NAMES.value, TN.GET_ALL_SPECIFICATIONS.value]
+DISCOVERY_WS_AGENT_NAMES = frozenset({DPA.ENTITY_EXTRACTION.value, DPA.QUERY_BUILDER_EXECUTOR.value, DPA.SUMMARIZER.value})
+DISCOVERY_WS_TOOLS_NAMES = frozenset({TN.GET_ALL_BRANDS_NAMES.value, TN.GET_ALL_SPECIFICATIONS.value})
 
 ALL_AGENT_REGISTRY = [
     {
@@ -30,18 +30,14 @@ ALL_TOOL_REGISTRY = [
     }
 ]
 
+# Both registries are static, so the discovery subsets are filtered once at import
+_DISCOVERY_AGENTS_REGISTRY = tuple(agent for agent in ALL_AGENT_REGISTRY if agent["AGENT_NAME"] in DISCOVERY_WS_AGENT_NAMES)
+_DISCOVERY_TOOLS_REGISTRY = tuple(tool for tool in ALL_TOOL_REGISTRY if tool["TOOL_NAME"] in DISCOVERY_WS_TOOLS_NAMES)
+
 def get_discovery_agents_registry() -> list[dict]:
     """ Returns the registry of all discovery workstream agents. """
-    discovery_agents_registry = []
-    for agent in ALL_AGENT_REGISTRY:
-        if agent["AGENT_NAME"] in DISCOVERY_WS_AGENT_NAMES:
-            discovery_agents_registry.append(agent)
-    return discovery_agents_registry
+    return list(_DISCOVERY_AGENTS_REGISTRY)
 
 def get_discovery_tools_registry() -> list[dict]:
     """ Returns the registry of all discovery workstream tools. """
-    discovery_tools_registry = []
-    for tool in ALL_TOOL_REGISTRY:
-        if tool["TOOL_NAME"] in DISCOVERY_WS_TOOLS_NAMES:
-            discovery_tools_registry.append(tool)
-    return discovery_tools_registry
+    return list(_DISCOVERY_TOOLS_REGISTRY)